@@ -5,57 +5,63 @@ from typing_extensions import Self
 
 __all__ = ['RgbConverter']
 
+# the constants are module-level, so that the conversions look them up as
+# globals rather than as attributes of `cls`
 
-class RgbConverter:
-    """A utility class to convert lists of integers into colors. Currently 
-    used to calculate the highlight colors for the ipv4 and ipv6 filters."""
-    _min24: Final[int] = 70
-    _max24: Final[int] = 255
-    _range24: Final[int] = _min24 - _max24
+_MIN24: Final[int] = 70
+_MAX24: Final[int] = 255
+_RANGE24: Final[int] = _MAX24 - _MIN24 + 1
+
+# all 8-bit colors with greyscale colors removed
+# specifically: 0, 7, 15, 231-255
+_VALUE_TABLE_8BIT: Final[bytes] = bytes(
+    x for x in range(256) if x not in (
+        0, 7, 15, *range(231, 256)))
 
-    # all 8-bit colors with greyscale colors removed
-    # specifically: 0, 7, 15, 231-255
-    _value_table_8bit: Final[Sequence[int]] = tuple(
-        x for x in range(256) if x not in (
-            0, 7, 15, *range(231, 256)))
+_RANGE8: Final[int] = len(_VALUE_TABLE_8BIT)
 
-    _range8: int = len(_value_table_8bit)
+
+class RgbConverter:
+    """A utility class to convert lists of integers and strings into colors. 
+    Currently used to calculate the highlight colors for the ipv4 and ipv6 
+    filters."""
 
     @classmethod
     def from_int_list_24bit(cls: type[Self],
                             lst: Sequence[int]
                             ) -> tuple[int, int, int]:
 
-        rgb_out = [0, 0, 0]
         extra_count = len(lst) % 3
         even_count = len(lst) - extra_count
 
-        for i in range(even_count):
-            rgb_out[i % 3] = (
-                rgb_out[i % 3] + lst[i] + hash(i)
-            ) % cls._range24
+        # each channel sums every third item, reducing the sum once per
+        # channel is equivalent to reducing it after every item
+        mixed: list[int] = [
+            item + hash(i) for i, item in enumerate(lst[:even_count])]
 
-        for i in range(extra_count):
-            amount: int = (
-                (lst[even_count + i] + hash(even_count + i)) // 3
-            ) % cls._range24
+        # the remaining items are added to every channel before it is reduced,
+        # so that each channel stays within _MIN24-_MAX24
+        amount: int = sum(
+            (lst[i] + hash(i)) // 3
+            for i in range(even_count, even_count + extra_count))
 
-            rgb_out[0] += amount
-            rgb_out[1] += amount
-            rgb_out[2] += amount
-
-        rgb_out[0] += cls._min24
-        rgb_out[1] += cls._min24
-        rgb_out[2] += cls._min24
+        rgb_out = [(sum(mixed[c::3]) + amount) % _RANGE24 + _MIN24
+                   for c in range(3)]
 
         return (rgb_out[0], rgb_out[1], rgb_out[2])
 
     @classmethod
     def from_int_list_8bit(cls: type[Self], lst: Sequence[int]) -> int:
 
-        rgb_out = 0
+        # reducing the sum once is equivalent to reducing it after every item
+        return _VALUE_TABLE_8BIT[sum(lst) % _RANGE8]
+
+    @classmethod
+    def from_str_8bit(cls: type[Self], s: str | bytes) -> int:
+        """Converts `s` into an 8-bit color by summing its bytes (a `str` is 
+        UTF-8 encoded first), such that equal strings are converted to equal 
+        colors. For ASCII text, the bytes are the character codes."""
 
-        for i in lst:
-            rgb_out = (rgb_out + i) % cls._range8
+        data: bytes = s if isinstance(s, bytes) else s.encode()
 
-        return cls._value_table_8bit[rgb_out]
+        return _VALUE_TABLE_8BIT[sum(data) % _RANGE8]
@@ -1,6 +1,5 @@
 """Base classes for filtering lines using regular expressions"""
 
-from abc import ABC, abstractmethod
 from typing import Callable
 from typing_extensions import Self
 import functools
@@ -10,21 +9,29 @@ all = ['LineRegexFilterBase', 'LineRegexFilter', 'lineregexfilter',
        'CompositeLineRegexFilter']
 
 
-class LineRegexFilterBase(ABC):
+class LineRegexFilterBase:
     """Base class for objects that filter (and optionally replace portions of) 
     lines of text using regular expressions."""
 
+    __slots__ = ('_pattern', '_cpattern', '_triggers')
+
     _pattern: str
     """A regular expression which determines what part of a line is matched."""
 
-    _cpattern: re.Pattern | None
-    """A compiled `re.Pattern` representing `_pattern`, or `None` if 
-    `_pattern` has not yet been used."""
+    _cpattern: re.Pattern
+    """A compiled `re.Pattern` representing `_pattern`."""
+
+    _triggers: tuple[str, ...] | None
+    """Distinct characters of which at least one must appear in a line for 
+    `_pattern` to match it, or `None` if every line may match."""
 
     def __call__(self: Self, line: str) -> str | None:
         """Attempts to match `_pattern` in line and passes any matches 
         to `_match_replace_callback`.
 
+        Lines which contain none of the `_triggers` are rejected without 
+        invoking the regex engine.
+
         Args:
             line: the line to match and replace against.
 
@@ -32,8 +39,8 @@ class LineRegexFilterBase(ABC):
             A replacement line, or `None` if the line was not matched.
         """
 
-        if self._cpattern is None:
-            self._cpattern = re.compile(self._pattern)
+        if self._quickreject(line):
+            return None
 
         new_line: str
         rcount: int
@@ -45,10 +52,54 @@ class LineRegexFilterBase(ABC):
 
         return new_line
 
-    @abstractmethod
+    def search(self: Self, line: str) -> str | None:
+        """Like `__call__`, except that the line is returned as-is when 
+        `_pattern` matches it. Cheaper, as the regex engine can stop at the 
+        first match and no replacement line is built.
+
+        Args:
+            line: the line to match against.
+
+        Returns:
+            `line`, or `None` if the line was not matched.
+        """
+
+        if self._quickreject(line):
+            return None
+
+        if self._cpattern.search(line) is None:
+            return None
+
+        return line
+
+    def _quickreject(self: Self, line: str) -> bool:
+        """Checks whether `line` contains none of the `_triggers`.
+
+        Each trigger is looked for with `in`, a C-level scan of the line that 
+        is much cheaper than running the regex engine (or a character class 
+        pattern) over it.
+
+        Args:
+            line: the line to check.
+
+        Returns:
+            `True` if `line` cannot be matched by `_pattern`, otherwise 
+            `False`.
+        """
+
+        if self._triggers is None:
+            return False
+
+        for trigger in self._triggers:
+            if trigger in line:
+                return False
+
+        return True
+
     def _match_replace_callback(self: Self, match: re.Match) -> str:
         """When overridden in a derived class, implements a callback for 
-        `re.sub`.
+        `re.sub`. Must be overridden, the base class raises 
+        `NotImplementedError`.
 
         Args:
             match: an object representing the matched text.
@@ -63,23 +114,33 @@ class LineRegexFilterBase(ABC):
 
 class LineRegexFilter(LineRegexFilterBase):
     """A basic implementation of `LineRegexFilterBase` that calls a 
-    supplied function to replace matched text."""
+    supplied function to replace matched text.
+
+    Unlike the other filters, instances keep a `__dict__`, which holds the 
+    attributes (e.g. `__doc__`) copied from the replacer by 
+    `functools.update_wrapper` so that the filters document themselves."""
 
     _replacer: Callable[[str], str]
     """A function that should convert a string into its replacement."""
 
     def __init__(self: Self,
                  replacer: Callable[[str], str],
-                 pattern: str
+                 pattern: str,
+                 triggers: str | None = None
                  ) -> None:
         """
         Args:
             replacer: A function that should convert a string into its
                 replacement.
             pattern: The regular expression to match.
+            triggers: If not `None`, characters of which at least one 
+                appears in any text matched by `pattern`. Lines containing 
+                none of them are rejected without invoking the regex engine.
         """
         self._pattern = pattern
-        self._cpattern = None
+        self._cpattern = re.compile(pattern)
+        self._triggers = (None if triggers is None
+                          else tuple(sorted(set(triggers))))
         self._replacer = replacer
         functools.update_wrapper(self, replacer)
 
@@ -91,13 +152,16 @@ class LineRegexFilter(LineRegexFilterBase):
         return self._replacer(matchstr)
 
 
-def lineregexfilter(pattern: str
+def lineregexfilter(pattern: str,
+                    triggers: str | None = None
                     ) -> Callable[[Callable[[str], str]], LineRegexFilter]:
     """Decorates a function that replaces text matched by the supplied regex
     `pattern`.
 
     Args:
         pattern: The regular expression pattern to match.
+        triggers: If not `None`, characters of which at least one appears in 
+            any text matched by `pattern`. See `LineRegexFilter`.
 
     Example::
 
@@ -107,7 +171,7 @@ def lineregexfilter(pattern: str
     """
 
     def _lineregexfilter(replacer: Callable[[str], str]) -> LineRegexFilter:
-        return LineRegexFilter(replacer, pattern)
+        return LineRegexFilter(replacer, pattern, triggers)
 
     return _lineregexfilter
 
@@ -121,8 +185,12 @@ class CompositeLineRegexFilter(LineRegexFilterBase):
     Importantly, this composite filter will only filter a line out if 
     none of the sub-filters matched."""
 
-    _subfilters: dict[str, LineRegexFilter]
-    """The individual sub-filters, stored by id."""
+    __slots__ = ('_replacers',)
+
+    _replacers: tuple[Callable[[str], str], ...]
+    """The `LineRegexFilter._replacer` of each sub-filter, indexed by the 
+    number of the regex group that encapsulates the sub-filter's pattern. 
+    Any other index holds `str`, which leaves the matched text as-is."""
 
     def __init__(self: Self, *filters: LineRegexFilter) -> None:
         """
@@ -132,29 +200,42 @@ class CompositeLineRegexFilter(LineRegexFilterBase):
 
         The `_pattern` of the individual `filters` are encapsulated in 
         regex groups and combined to form this instance's `_pattern`. 
-        The regex groups are given unique ids so that the sub-filter whose 
-        pattern matched can be determined from the `re.Match` object.
-        """
+        The regex groups are numbered so that the sub-filter whose pattern 
+        matched can be determined from `re.Match.lastindex`, the outermost 
+        group always being the last to close.
 
-        self._subfilters = {}
-        subpatterns: list[str] = []
+        The `_triggers` of the individual `filters` are combined likewise, 
+        unless any of them has none (or there are no `filters`, in which 
+        case the empty pattern matches every line).
+        """
 
-        for f in filters:
-            key_name = f'_{hex(id(f)).removeprefix("0x")}'
-            self._subfilters[key_name] = f
-            subpatterns.append(f'(?P<{key_name}>{f._pattern})')
+        subpatterns: list[str] = [
+            f'(?P<_f{idx}>{f._pattern})' for idx, f in enumerate(filters)]
 
         self._pattern = '|'.join(subpatterns)
-        self._cpattern = None
+        self._cpattern = re.compile(self._pattern)
 
-    def _match_replace_callback(self: Self, match: re.Match) -> str:
-        """Checks the group id of the pattern that was matched and delegates 
-        to the appropriate `_subfilter`.`LineRegexFilter._replacer` to perform 
-        the replacement of the matched text."""
+        replacers: list[Callable[[str], str]] = [
+            str for _ in range(self._cpattern.groups + 1)]
 
-        if match.lastgroup is None or match.lastgroup not in self._subfilters:
-            return match.string
+        for idx, f in enumerate(filters):
+            replacers[self._cpattern.groupindex[f'_f{idx}']] = f._replacer
 
-        matchstr: str = match.group(0)
+        self._replacers = tuple(replacers)
+
+        triggers: set[str] = set()
+
+        for f in filters:
+            if f._triggers is None:
+                self._triggers = None
+                break
+            triggers.update(f._triggers)
+        else:
+            self._triggers = tuple(sorted(triggers)) if filters else None
+
+    def _match_replace_callback(self: Self, match: re.Match) -> str:
+        """Checks the group number of the pattern that was matched and 
+        delegates to the appropriate `LineRegexFilter._replacer` in 
+        `_replacers` to perform the replacement of the matched text."""
 
-        return self._subfilters[match.lastgroup]._replacer(matchstr)
+        return self._replacers[match.lastindex or 0](match.group(0))
@@ -10,14 +10,20 @@
 from ._linefiltering._regexfilterbase import (LineRegexFilter,
                                               CompositeLineRegexFilter)
 from ._linefilters import ipv4_filter, ipv6_filter, timestamp_filter
-from ._misc import indirect_filter, filtermap
-from typing import Iterable, Optional, TextIO
+from ._misc import indirect_filter
+from typing import Callable, Iterable, Optional, TextIO
+from click.globals import resolve_color_default
 import click
 import collections
+import functools
 import itertools
+import sys
 
 __all__ = ['clilogfilter', 'main']
 
+_ECHO_BATCH_SIZE: int = 1024
+"""The number of lines that are written to stdout at a time."""
+
 
 @click.command(context_settings={'help_option_names': ['-h', '--help']},
                options_metavar="[OPTIONS...]",
@@ -84,12 +90,17 @@ def clilogfilter(first: Optional[int],
     firstlast_filters: list[Iterable[str]] = []
 
     if first is not None:
-        firstlast_filters.append(
-            line for _, line in zip(range(first), line_iter))
+        firstlast_filters.append(itertools.islice(line_iter, first))
 
     if last is not None:
-        firstlast_filters.append(
-            indirect_filter(collections.deque[str], line_iter, maxlen=last))
+        if first is None:
+            # nothing else consumes `line_iter`, so the deque can be filled
+            # in one go rather than once iteration begins
+            firstlast_filters.append(
+                collections.deque(line_iter, maxlen=last))
+        else:
+            firstlast_filters.append(indirect_filter(
+                collections.deque[str], line_iter, maxlen=last))
 
     if len(firstlast_filters) > 1:
         # chain the filters (back-to-back) if there is more than one
@@ -97,8 +108,44 @@ def clilogfilter(first: Optional[int],
     elif firstlast_filters:
         line_iter = firstlast_filters[0]
 
-    # add regex-based filters around `line_iter` to filter out lines that do
-    # not match any filter and add highlighting
+    # add regex-based filters to filter out lines that do not match any
+    # filter and add highlighting
+    line_filter: Optional[Callable[[str], str | None]] = None
+
+    if timestamps or ipv4 or ipv6:
+        composite_filter = _get_composite((timestamps, ipv4, ipv6))
+
+        # highlighting would only be stripped again by `click.echo`, so only
+        # match lines without adding it
+        line_filter = (composite_filter if _keeps_styling()
+                       else composite_filter.search)
+
+    # reading from a pipe or terminal can block until more input is written,
+    # so lines are printed as soon as they are read, unless `--last` has
+    # already read all of it
+    batch_size: int = (_ECHO_BATCH_SIZE
+                       if file.seekable()
+                       or isinstance(line_iter, collections.deque)
+                       else 1)
+
+    # iterate over the the filtered lines and print them
+    _echo_lines(line_iter, line_filter, batch_size)
+
+
+@functools.lru_cache(maxsize=8)
+def _get_composite(flags: tuple[bool, bool, bool]
+                   ) -> CompositeLineRegexFilter:
+    """Builds the composite of the regex-based filters enabled by `flags`, 
+    cached so that its pattern is only compiled once per combination.
+
+    Args:
+        flags: Whether the timestamp, ipv4 and ipv6 filters (respectively) 
+            are enabled. At least one should be `True`.
+
+    Returns:
+        A `CompositeLineRegexFilter` of the enabled filters.
+    """
+    timestamps, ipv4, ipv6 = flags
     regex_filters: list[LineRegexFilter] = []
 
     if timestamps:
@@ -108,13 +155,86 @@ def clilogfilter(first: Optional[int],
     if ipv6:
         regex_filters.append(ipv6_filter)
 
-    if regex_filters:
-        line_iter = filtermap(
-            CompositeLineRegexFilter(*regex_filters), line_iter)
+    return CompositeLineRegexFilter(*regex_filters)
 
-    # iterate over the the filtered lines and print them
-    for line in line_iter:
-        click.echo(line.rstrip('\n'))
+
+def _keeps_styling() -> bool:
+    """Determines whether `click.echo` keeps the styling of text printed to 
+    stdout, by asking `click` in the same way that `click.echo` does (which 
+    also lets `click.testing.CliRunner` decide).
+
+    `should_strip_ansi` and `resolve_color_default` are not documented as 
+    part of `click`'s api, which is why `click` is pinned to 8.x in 
+    setup.cfg. The documented `click.Context.color` is not enough, as 
+    `CliRunner.invoke(color=...)` never sets it.
+
+    Returns:
+        `False` if styling would be stripped, otherwise `True`.
+    """
+    return not click.utils.should_strip_ansi(sys.stdout,
+                                             resolve_color_default())
+
+
+def _echo_lines(lines: Iterable[str],
+                line_filter: Optional[Callable[[str], str | None]] = None,
+                batch_size: int = _ECHO_BATCH_SIZE
+                ) -> None:
+    """Prints `lines` to stdout, `batch_size` lines at a time.
+
+    `click.echo` flushes stdout after every call, so batching the lines 
+    saves a write (and any styling checks) per line. A batch is only printed 
+    once it is full (or `lines` runs out), so `batch_size` should be 1 if 
+    `lines` may block waiting for input, otherwise the lines read so far are 
+    held back.
+
+    Args:
+        lines: The lines to print. A newline is added to any line that does 
+            not end in one.
+        line_filter: If not `None`, a function (such as a 
+            `CompositeLineRegexFilter`) that each line is replaced with the 
+            result of, or excluded if the result is `None`. Applied in 
+            batches, rather than through a generator such as `filtermap`, to 
+            save a generator frame per line.
+        batch_size: The maximum number of lines printed at a time.
+
+    Raises:
+        Any exception raised while reading `lines` (such as a 
+        `UnicodeDecodeError`), but only after the lines read before it have 
+        been printed.
+    """
+    line_iter: Iterable[str] = iter(lines)
+
+    while True:
+        batch: list[str] = []
+
+        try:
+            # `list.extend` keeps the lines it has already read if reading
+            # the next one raises, so they can still be printed
+            batch.extend(itertools.islice(line_iter, batch_size))
+        finally:
+            _echo_batch(batch, line_filter)
+
+        if not batch:
+            break
+
+
+def _echo_batch(batch: list[str],
+                line_filter: Optional[Callable[[str], str | None]]
+                ) -> None:
+    """Prints a batch of `_echo_lines` to stdout with a single `click.echo`.
+
+    Args:
+        batch: The lines to print.
+        line_filter: See `_echo_lines`.
+    """
+    if line_filter is not None:
+        batch = [line for line in map(line_filter, batch)
+                 if line is not None]
+
+    if batch:
+        click.echo(''.join(line if line.endswith('\n') else line + '\n'
+                           for line in batch),
+                   nl=False)
 
 
 def main() -> None:
@@ -0,0 +1,119 @@
+"""Contains helpers for testing the `pylogutil.util` cli application."""
+
+from dataclasses import dataclass
+from typing import ClassVar, Optional, Sequence
+from typing_extensions import Self
+from click.testing import CliRunner, Result
+from pylogutil.util import clilogfilter
+
+
+@dataclass
+class CliArgs:
+    """Stores arguments for the `pylogutil.util` cli application."""
+
+    help: bool = False
+    version: bool = False
+    first: Optional[int] = None
+    last: Optional[int] = None
+    timestamps: bool = False
+    ipv4: bool = False
+    ipv6: bool = False
+    file: Optional[str] = None
+
+    _FLAGS: ClassVar[tuple[tuple[str, str, bool], ...]] = (
+        ('help', '--help', False),
+        ('version', '--version', False),
+        ('first', '--first', True),
+        ('last', '--last', True),
+        ('timestamps', '--timestamps', False),
+        ('ipv4', '--ipv4', False),
+        ('ipv6', '--ipv6', False),
+        ('file', '--file', True),
+    )
+    """The name of each argument, its cli flag, and whether the flag takes a 
+    value (included unless `None`) or is a switch (included if `True`), in 
+    the order they are passed to `clilogfilter`."""
+
+    def to_arg_list(self: Self) -> Sequence[str]:
+        """Converts all argument values into a list of strings which can 
+        be used to invoke `clilogfilter` with the same arguments."""
+
+        args: list[str] = []
+
+        for name, flag, takes_value in self._FLAGS:
+            value: bool | int | str | None = getattr(self, name)
+
+            if takes_value:
+                if value is not None:
+                    args += (flag, str(value))
+            elif value:
+                args.append(flag)
+
+        return args
+
+
+@dataclass
+class Expect:
+    """Represents the expected outcome of a cli application"""
+
+    exit_code: Optional[int] = 0
+    stdout: Optional[str] = None
+    stderr: Optional[str] = None
+
+
+class Invoker():
+    """Invokes the `pylogutil.util` cli application using the supplied
+    arguments."""
+
+    _runner: CliRunner
+
+    _encoded_stdin: dict[str, bytes]
+    """The stdin of previous invocations, encoded with the runner's charset. 
+    The tests reuse the same few logs as stdin, and `CliRunner` would 
+    otherwise encode them again on every invocation."""
+
+    def __init__(self: Self, runner: CliRunner) -> None:
+        self._runner = runner
+        self._encoded_stdin = {}
+
+    def __call__(self: Self,
+                 args: CliArgs,
+                 stdin: Optional[str | bytes] = None,
+                 expect: Expect = Expect(),
+                 color: bool = True
+                 ) -> Result:
+        """
+        Args:
+            args: The application arguments.
+            stdin: If not `None`, the application's stdin. Defaults to `None`.
+            expect: The expected application result.
+                Defaults to a default `Expect` instance.
+            color: Whether application output should include color codes.
+                Defaults to `True`.
+
+        Returns:
+            The cli application result.
+        """
+
+        if isinstance(stdin, str):
+            encoded: bytes | None = self._encoded_stdin.get(stdin)
+
+            if encoded is None:
+                encoded = stdin.encode(self._runner.charset)
+                self._encoded_stdin[stdin] = encoded
+
+            stdin = encoded
+
+        result: Result = self._runner.invoke(
+            clilogfilter, args.to_arg_list(), stdin, color=color)
+
+        if expect.exit_code is not None:
+            assert result.exit_code == expect.exit_code
+
+        if expect.stdout is not None:
+            assert result.stdout == expect.stdout
+
+        if expect.stderr is not None:
+            assert result.stderr == expect.stderr
+
+        return result
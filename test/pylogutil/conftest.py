@@ -0,0 +1,15 @@
+"""Contains fixtures shared by the `pylogutil` tests."""
+
+from click.testing import CliRunner
+from .clihelpers import Invoker
+import pytest
+
+
+@pytest.fixture(scope="session")
+def runner():
+    return CliRunner()
+
+
+@pytest.fixture(scope="session")
+def invoker(runner: CliRunner) -> Invoker:
+    return Invoker(runner)
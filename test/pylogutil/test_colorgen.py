@@ -0,0 +1,35 @@
+"""Contains tests for `pylogutil._linefiltering._colorgen`."""
+
+from typing import Sequence
+from pylogutil._linefiltering._colorgen import RgbConverter
+import pytest
+
+
+@pytest.mark.parametrize(
+    ('lst',),
+    [
+        pytest.param([],
+                     id='1_empty'),
+
+        pytest.param([255] * 3,
+                     id='2_length-multiple-of-3'),
+
+        pytest.param([255] * 7,
+                     id='3_one-extra-item'),
+
+        pytest.param([255] * 8,
+                     id='4_two-extra-items'),
+
+        pytest.param([0] * 8,
+                     id='5_zeros'),
+
+        pytest.param(list(b'fe80:12::34:fff'),
+                     id='6_ipv6-address-bytes'),
+
+        pytest.param(list(range(256)) * 4 + [255, 255],
+                     id='7_long'),
+    ]
+)
+def test_from_int_list_24bit_range(lst: Sequence[int]) -> None:
+    for channel in RgbConverter.from_int_list_24bit(lst):
+        assert 70 <= channel <= 255
@@ -0,0 +1,135 @@
+"""Contains tests for `pylogutil._linefiltering._regexfilterbase`."""
+
+from typing import Optional, Sequence
+from pylogutil._linefiltering._regexfilterbase import (
+    LineRegexFilter, CompositeLineRegexFilter)
+from pylogutil._linefilters import ipv4_filter, ipv6_filter, timestamp_filter
+import pytest
+
+
+def _bracket(text: str) -> str:
+    """A replacer that wraps matched text in brackets."""
+    return f'[{text}]'
+
+
+_DIGITS = LineRegexFilter(_bracket, r'[0-9]+', triggers='0123456789')
+"""A filter that matches digits, triggered by any digit."""
+
+_COLONS = LineRegexFilter(_bracket, r':+', triggers=':')
+"""A filter that matches runs of colons, triggered by a colon."""
+
+_WORDS = LineRegexFilter(_bracket, r'[a-z]+')
+"""A filter that matches words, without any triggers."""
+
+
+@pytest.mark.parametrize(
+    ('filters', 'expected_triggers'),
+    [
+        pytest.param((),
+                     None,
+                     id='1_no-filters'),
+
+        pytest.param((_COLONS,),
+                     (':',),
+                     id='2_one-filter'),
+
+        pytest.param((_COLONS, _DIGITS),
+                     tuple(sorted('0123456789:')),
+                     id='3_union-of-filters'),
+
+        pytest.param((_COLONS, _COLONS),
+                     (':',),
+                     id='4_overlapping-filters'),
+
+        pytest.param((_COLONS, _WORDS, _DIGITS),
+                     None,
+                     id='5_filter-without-triggers'),
+    ]
+)
+def test_composite_triggers(filters: Sequence[LineRegexFilter],
+                            expected_triggers: Optional[tuple[str, ...]]
+                            ) -> None:
+    assert CompositeLineRegexFilter(*filters)._triggers == expected_triggers
+
+
+@pytest.mark.parametrize(
+    ('line',),
+    [
+        pytest.param('',
+                     id='1_empty-line'),
+
+        pytest.param('no triggers here\n',
+                     id='2_line-without-triggers'),
+    ]
+)
+def test_composite_without_filters(line: str) -> None:
+    composite = CompositeLineRegexFilter()
+
+    assert composite(line) == line
+    assert composite.search(line) == line
+
+
+@pytest.mark.parametrize(
+    ('line', 'expected_line'),
+    [
+        pytest.param('at 12:34:56 from 10.0.0.1\n',
+                     '[at] [12][:][34][:][56] [from] [10].[0].[0].[1]\n',
+                     id='1_all-filters-match'),
+
+        pytest.param('12 34\n',
+                     '[12] [34]\n',
+                     id='2_one-filter-matches'),
+
+        pytest.param('.;!?\n',
+                     None,
+                     id='3_no-filter-matches'),
+    ]
+)
+def test_composite_replacement(line: str,
+                               expected_line: Optional[str]
+                               ) -> None:
+    composite = CompositeLineRegexFilter(_DIGITS, _COLONS, _WORDS)
+
+    assert composite(line) == expected_line
+
+
+@pytest.mark.parametrize(
+    ('line',),
+    [
+        pytest.param('start 12:34:56 end\n',
+                     id='1_timestamp'),
+
+        pytest.param('from 192.168.1.1\n',
+                     id='2_ipv4'),
+
+        pytest.param('from fe80::1\n',
+                     id='3_ipv6'),
+
+        pytest.param('version 1.2 at 12:34\n',
+                     id='4_triggers-without-match'),
+
+        pytest.param('no triggers here\n',
+                     id='5_no-triggers'),
+
+        pytest.param('',
+                     id='6_empty-line'),
+    ]
+)
+def test_search_agrees_with_call(line: str) -> None:
+    composite = CompositeLineRegexFilter(timestamp_filter,
+                                         ipv4_filter,
+                                         ipv6_filter)
+
+    assert composite.search(line) == (
+        None if composite(line) is None else line)
+
+
+def test_triggers_reject_lines() -> None:
+    # a line without any of the triggers is rejected without running the
+    # pattern, even though the pattern would match it
+    digits = LineRegexFilter(_bracket, r'[0-9]+', triggers='x')
+
+    assert digits('123\n') is None
+    assert digits.search('123\n') is None
+    assert digits('x123\n') == 'x[123]\n'
+    assert digits.search('x123\n') == 'x123\n'
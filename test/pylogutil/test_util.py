@@ -1,63 +1,103 @@
 """Contains tests for the `pylogutil.util` cli application."""
 
-from dataclasses import dataclass
-from typing import Optional, Sequence
-from typing_extensions import Self
+from typing import Callable, Optional, Sequence
 import click
-from click.testing import CliRunner, Result
-from pylogutil.util import clilogfilter
 from pylogutil._linefiltering._colorgen import RgbConverter
+from .clihelpers import CliArgs, Expect, Invoker
+import functools
+import io
+import os
+import pylogutil
 import pytest
+import queue
+import subprocess
+import sys
+import threading
 
 
-@dataclass
-class CliArgs:
-    """Stores arguments for the `pylogutil.util` cli application."""
+# the test parameters are built from the same few logs over and over, so the
+# log generators below are cached
 
-    help: bool = False
-    version: bool = False
-    first: Optional[int] = None
-    last: Optional[int] = None
-    timestamps: bool = False
-    ipv4: bool = False
-    ipv6: bool = False
-    file: Optional[str] = None
+_LINE_NUMBER_LINE: Callable[[int], str] = 'Line {}\n'.format
+"""Formats a line of `line_number_log`."""
 
-    def to_arg_list(self: Self) -> Sequence[str]:
-        """Converts all argument values into a list of strings which can 
-        be used to invoke `clilogfilter` with the same arguments."""
+# the remaining logs repeat after a fixed number of lines, so every distinct
+# line is built once up front
+_TIMESTAMP_LINES: tuple[str, ...] = tuple(f'[12:34:{i:02}]: Timestamp\n'
+                                          for i in range(100))
+"""The lines of `timestamp_log`, indexed by line number modulo 100."""
 
-        args: list[str] = []
+_TIMESTAMP_STYLED_LINES: tuple[str, ...] = tuple(
+    '[' + click.style(f'12:34:{i:02}', bold=True, fg='bright_white') +
+    ']: Timestamp\n'
+    for i in range(100))
+"""The lines of `timestamp_styled_log`, indexed by line number modulo 100."""
 
-        if self.help:
-            args.append('--help')
-        if self.version:
-            args.append('--version')
-        if self.first is not None:
-            args.extend(['--first', str(self.first)])
-        if self.last is not None:
-            args.extend(['--last', str(self.last)])
-        if self.timestamps:
-            args.append('--timestamps')
-        if self.ipv4:
-            args.append('--ipv4')
-        if self.ipv6:
-            args.append('--ipv6')
-        if self.file is not None:
-            args.extend(['--file', self.file])
+_IPV4_ADDRESSES: tuple[str, ...] = tuple(f'192.168.1.{i}' for i in range(256))
+"""The addresses of `ipv4_log`, indexed by line number modulo 256."""
 
-        return args
+_IPV4_LINES: tuple[str, ...] = tuple(f'An IPv4: {address}\n'
+                                     for address in _IPV4_ADDRESSES)
+"""The lines of `ipv4_log`, indexed by line number modulo 256."""
 
+_IPV4_STYLED_LINES: tuple[str, ...] = tuple(
+    'An IPv4: ' +
+    click.style(address,
+                underline=True,
+                fg=RgbConverter.from_str_8bit(address)) + '\n'
+    for address in _IPV4_ADDRESSES)
+"""The lines of `ipv4_styled_log`, indexed by line number modulo 256."""
 
-@dataclass
-class Expect:
-    """Represents the expected outcome of a cli application"""
+_IPV6_ADDRESSES: tuple[str, ...] = tuple(f'fe80:12::34:{i:x}'
+                                         for i in range(0x1000))
+"""The addresses of `ipv6_log`, indexed by line number modulo 0x1000."""
 
-    exit_code: Optional[int] = 0
-    stdout: Optional[str] = None
-    stderr: Optional[str] = None
+_IPV6_LINES: tuple[str, ...] = tuple(f'An IPv6: {address}\n'
+                                     for address in _IPV6_ADDRESSES)
+"""The lines of `ipv6_log`, indexed by line number modulo 0x1000."""
 
+_IPV6_STYLED_LINES: tuple[str, ...] = tuple(
+    'An IPv6: ' +
+    click.style(address,
+                underline=True,
+                fg=RgbConverter.from_str_8bit(address)) + '\n'
+    for address in _IPV6_ADDRESSES)
+"""The lines of `ipv6_styled_log`, indexed by line number modulo 0x1000."""
 
+
+def _styled_ip(address: str) -> str:
+    """Applies the styling the ipv4 and ipv6 filters apply to `address`.
+
+    Args:
+        address: The ip address.
+
+    Returns:
+        The styled address.
+    """
+    return click.style(address,
+                       underline=True,
+                       fg=RgbConverter.from_str_8bit(address))
+
+
+def _repeating_log(lines: Sequence[str], nlines: int, start: int) -> str:
+    """Generates a log file string with `nlines` lines that repeat `lines`, 
+    where line number ``i`` is ``lines[i % len(lines)]``.
+
+    Args:
+        lines: The distinct lines of the log, each followed by a newline 
+            character (``\\n``).
+        nlines: The number of lines.
+        start: the line number to start on.
+
+    Returns:
+        The log file string.
+    """
+    period: int = len(lines)
+    return ''.join([lines[i % period]
+                    for i in range(1 + start, 1 + start + nlines)])
+
+
+@functools.lru_cache(maxsize=32)
 def line_number_log(nlines: int, start: int = 0) -> str:
     """Generates a log file string with `nlines` lines in the format: 
     ``Line 1``, ``Line 2``, ...
@@ -70,10 +110,11 @@ def line_number_log(nlines: int, start: int = 0) -> str:
         A string where each line is followed by a newline character (``\\n``).
     """
 
-    return ''.join(f'Line {i}\n'
-                   for i in range(1 + start, 1 + start + nlines))
+    return ''.join(map(_LINE_NUMBER_LINE,
+                       range(1 + start, 1 + start + nlines)))
 
 
+@functools.lru_cache(maxsize=32)
 def timestamp_log(nlines: int, start: int = 0) -> str:
     """Generates a log file string with `nlines` lines in the format: 
     ``[12:34:01]: Timestamp``, ``[12:34:02]: Timestamp``, ...
@@ -85,10 +126,10 @@ def timestamp_log(nlines: int, start: int = 0) -> str:
     Returns:
         A string where each line is followed by a newline character (``\\n``).
     """
-    return ''.join(f'[12:34:{i%100:02}]: Timestamp\n'
-                   for i in range(1 + start, 1 + start + nlines))
+    return _repeating_log(_TIMESTAMP_LINES, nlines, start)
 
 
+@functools.lru_cache(maxsize=32)
 def timestamp_styled_log(nlines: int, start: int = 0) -> str:
     """Generates a log file string with `nlines` lines in the format: 
     ``[12:34:01]: Timestamp``, ``[12:34:02]: Timestamp``, ...
@@ -101,14 +142,10 @@ def timestamp_styled_log(nlines: int, start: int = 0) -> str:
     Returns:
         A string where each line is followed by a newline character (``\\n``).
     """
-    return ''.join('[' +
-                   click.style(f'12:34:{i%100:02}',
-                               bold=True,
-                               fg='bright_white') +
-                   ']: Timestamp\n'
-                   for i in range(1 + start, 1 + start + nlines))
+    return _repeating_log(_TIMESTAMP_STYLED_LINES, nlines, start)
 
 
+@functools.lru_cache(maxsize=32)
 def ipv4_log(nlines: int, start: int = 0) -> str:
     """Generates a log file string with `nlines` lines in the format: 
     ``An IPv4: 192.168.1.1``, ``An IPv4: 192.168.1.2``, ...
@@ -120,10 +157,10 @@ def ipv4_log(nlines: int, start: int = 0) -> str:
     Returns:
         A string where each line is followed by a newline character (``\\n``).
     """
-    return ''.join(f'An IPv4: 192.168.1.{i%256}\n'
-                   for i in range(1 + start, 1 + start + nlines))
+    return _repeating_log(_IPV4_LINES, nlines, start)
 
 
+@functools.lru_cache(maxsize=32)
 def ipv4_styled_log(nlines: int, start: int = 0) -> str:
     """Generates a log file string with `nlines` lines in the format: 
     ``An IPv4: 192.168.1.1``, ``An IPv4: 192.168.1.2``, ...
@@ -136,15 +173,10 @@ def ipv4_styled_log(nlines: int, start: int = 0) -> str:
     Returns:
         A string where each line is followed by a newline character (``\\n``).
     """
-    return ''.join('An IPv4: ' +
-                   click.style(f'192.168.1.{i%256}',
-                               underline=True,
-                               fg=RgbConverter.from_int_list_8bit([
-                                   192, 168, 1, i % 256
-                               ])) + '\n'
-                   for i in range(1 + start, 1 + start + nlines))
+    return _repeating_log(_IPV4_STYLED_LINES, nlines, start)
 
 
+@functools.lru_cache(maxsize=32)
 def ipv6_log(nlines: int, start: int = 0) -> str:
     """Generates a log file string with `nlines` lines in the format: 
     ``An IPv6: fe80:12::34:1``, ``An IPv6: fe80:12::34:2``, ...
@@ -156,10 +188,10 @@ def ipv6_log(nlines: int, start: int = 0) -> str:
     Returns:
         A string where each line is followed by a newline character (``\\n``).
     """
-    return ''.join(f'An IPv6: fe80:12::34:{i % 0x1000 :x}\n'
-                   for i in range(1 + start, 1 + start + nlines))
+    return _repeating_log(_IPV6_LINES, nlines, start)
 
 
+@functools.lru_cache(maxsize=32)
 def ipv6_styled_log(nlines: int, start: int = 0) -> str:
     """Generates a log file string with `nlines` lines in the format: 
     ``An IPv6: fe80:12::34:1``, ``An IPv6: fe80:12::34:2``, ...
@@ -172,71 +204,11 @@ def ipv6_styled_log(nlines: int, start: int = 0) -> str:
     Returns:
         A string where each line is followed by a newline character (``\\n``).
     """
-    return ''.join('An IPv6: ' +
-                   click.style(f'fe80:12::34:{i % 0x1000 :x}',
-                               underline=True,
-                               fg=RgbConverter.from_int_list_8bit([
-                                   0xfe80, 0x12, 0, 0,
-                                   0, 0, 0x34, i % 0x1000
-                               ])) + '\n'
-                   for i in range(1 + start, 1 + start + nlines))
-
-
-@pytest.fixture(scope="module")
-def runner():
-    return CliRunner()
-
-
-class Invoker():
-    """Invokes the `pylogutil.util` cli application using the supplied
-    arguments."""
-
-    _runner: CliRunner
-
-    def __init__(self: Self, runner: CliRunner) -> None:
-        self._runner = runner
-
-    def __call__(self: Self,
-                 args: CliArgs,
-                 stdin: Optional[str] = None,
-                 expect: Expect = Expect(),
-                 color: bool = True
-                 ) -> Result:
-        """
-        Args:
-            args: The application arguments.
-            stdin: If not `None`, the application's stdin. Defaults to `None`.
-            expect: The expected application result.
-                Defaults to a default `Expect` instance.
-            color: Whether application output should include color codes.
-                Defaults to `True`.
-
-        Returns:
-            The cli application result.
-        """
-
-        result: Result = self._runner.invoke(
-            clilogfilter, args.to_arg_list(), stdin, color=color)
-
-        if expect.exit_code is not None:
-            assert result.exit_code == expect.exit_code
-
-        if expect.stdout is not None:
-            assert result.stdout == expect.stdout
-
-        if expect.stderr is not None:
-            assert result.stderr == expect.stderr
-
-        return result
-
-
-@pytest.fixture(scope="module")
-def invoker(runner: CliRunner) -> Invoker:
-    return Invoker(runner)
+    return _repeating_log(_IPV6_STYLED_LINES, nlines, start)
 
 
 @pytest.mark.parametrize(
-    ('first', 'stdin', 'expected_value'),
+    ('first', 'stdin', 'expected_stdout'),
     [
         pytest.param(7, line_number_log(7),
                      line_number_log(7),
@@ -257,31 +229,43 @@ def invoker(runner: CliRunner) -> Invoker:
         pytest.param(7, '\n',
                      '\n',
                      id='5_first-nonzero_one-blank-line-log'),
-
-        pytest.param(0, None,
-                     2,
-                     id='6_first-zero'),
-
-        pytest.param(-7, None,
-                     2,
-                     id='7_first-negative'),
     ]
 )
 def test_first(invoker: Invoker,
                first: int,
                stdin: Optional[str],
-               expected_value: str | int
+               expected_stdout: str
                ) -> None:
     invoker(
         CliArgs(first=first),
         stdin,
-        Expect(**{
-            ('exit_code' if isinstance(expected_value, int) else 'stdout'):
-                expected_value}))
+        Expect(stdout=expected_stdout))
+
+
+@pytest.mark.parametrize(
+    ('first', 'expected_exit_code'),
+    [
+        pytest.param(0,
+                     2,
+                     id='1_first-zero'),
+
+        pytest.param(-7,
+                     2,
+                     id='2_first-negative'),
+    ]
+)
+def test_first_invalid(invoker: Invoker,
+                       first: int,
+                       expected_exit_code: int
+                       ) -> None:
+    invoker(
+        CliArgs(first=first),
+        None,
+        Expect(exit_code=expected_exit_code))
 
 
 @pytest.mark.parametrize(
-    ('last', 'stdin', 'expected_value'),
+    ('last', 'stdin', 'expected_stdout'),
     [
         pytest.param(7, line_number_log(7),
                      line_number_log(7),
@@ -302,31 +286,43 @@ def test_first(invoker: Invoker,
         pytest.param(7, '\n',
                      '\n',
                      id='5_last-nonzero_one-blank-line-log'),
-
-        pytest.param(0, None,
-                     2,
-                     id='6_last-zero'),
-
-        pytest.param(-7, None,
-                     2,
-                     id='7_last-negative'),
     ]
 )
 def test_last(invoker: Invoker,
               last: int,
               stdin: Optional[str],
-              expected_value: str | int
+              expected_stdout: str
               ) -> None:
     invoker(
         CliArgs(last=last),
         stdin,
-        Expect(**{
-            ('exit_code' if isinstance(expected_value, int) else 'stdout'):
-                expected_value}))
+        Expect(stdout=expected_stdout))
 
 
 @pytest.mark.parametrize(
-    ('first', 'last', 'stdin', 'expected_value'),
+    ('last', 'expected_exit_code'),
+    [
+        pytest.param(0,
+                     2,
+                     id='1_last-zero'),
+
+        pytest.param(-7,
+                     2,
+                     id='2_last-negative'),
+    ]
+)
+def test_last_invalid(invoker: Invoker,
+                      last: int,
+                      expected_exit_code: int
+                      ) -> None:
+    invoker(
+        CliArgs(last=last),
+        None,
+        Expect(exit_code=expected_exit_code))
+
+
+@pytest.mark.parametrize(
+    ('first', 'last', 'stdin', 'expected_stdout'),
     [
         pytest.param(2, 4, line_number_log(7),
                      (line_number_log(2) + line_number_log(4, 3)),
@@ -345,18 +341,16 @@ def test_firstlast(invoker: Invoker,
                    first: int,
                    last: int,
                    stdin: Optional[str],
-                   expected_value: str | int
+                   expected_stdout: str
                    ) -> None:
     invoker(
         CliArgs(first=first, last=last),
         stdin,
-        Expect(**{
-            ('exit_code' if isinstance(expected_value, int) else 'stdout'):
-                expected_value}))
+        Expect(stdout=expected_stdout))
 
 
 @pytest.mark.parametrize(
-    ('stdin', 'expected_value'),
+    ('stdin', 'expected_stdout'),
     [
         pytest.param(timestamp_log(7),
                      timestamp_styled_log(7),
@@ -378,18 +372,16 @@ def test_firstlast(invoker: Invoker,
 )
 def test_timestamps(invoker: Invoker,
                     stdin: Optional[str],
-                    expected_value: str | int
+                    expected_stdout: str
                     ) -> None:
     invoker(
         CliArgs(timestamps=True),
         stdin,
-        Expect(**{
-            ('exit_code' if isinstance(expected_value, int) else 'stdout'):
-                expected_value}))
+        Expect(stdout=expected_stdout))
 
 
 @pytest.mark.parametrize(
-    ('stdin', 'expected_value'),
+    ('stdin', 'expected_stdout'),
     [
         pytest.param(ipv4_log(7),
                      ipv4_styled_log(7),
@@ -411,18 +403,16 @@ def test_timestamps(invoker: Invoker,
 )
 def test_ipv4(invoker: Invoker,
               stdin: Optional[str],
-              expected_value: str | int
+              expected_stdout: str
               ) -> None:
     invoker(
         CliArgs(ipv4=True),
         stdin,
-        Expect(**{
-            ('exit_code' if isinstance(expected_value, int) else 'stdout'):
-                expected_value}))
+        Expect(stdout=expected_stdout))
 
 
 @pytest.mark.parametrize(
-    ('stdin', 'expected_value'),
+    ('stdin', 'expected_stdout'),
     [
         pytest.param(ipv6_log(7),
                      ipv6_styled_log(7),
@@ -440,15 +430,199 @@ def test_ipv4(invoker: Invoker,
                      (ipv6_styled_log(2) +
                       ipv6_styled_log(2)),
                      id='3_start-and-end-lines-match'),
+
+        pytest.param('An IPv6: 2001:db8:85a3:0:0:8a2e:370:7334\n',
+                     ('An IPv6: ' +
+                      _styled_ip('2001:db8:85a3:0:0:8a2e:370:7334') + '\n'),
+                     id='4_full-form'),
+
+        pytest.param('An IPv6: ::1\n',
+                     'An IPv6: ' + _styled_ip('::1') + '\n',
+                     id='5_leading-double-colon'),
+
+        pytest.param('An IPv6: fe80:12::\n',
+                     'An IPv6: ' + _styled_ip('fe80:12::') + '\n',
+                     id='6_trailing-double-colon'),
+
+        pytest.param('An IPv6: 0::1\n',
+                     'An IPv6: ' + _styled_ip('0::1') + '\n',
+                     id='7_zero-before-double-colon'),
+
+        pytest.param('An IPv6: fe80::0:1\n',
+                     'An IPv6: ' + _styled_ip('fe80::0:1') + '\n',
+                     id='8_zero-after-double-colon'),
+
+        pytest.param('An IPv6: 2001:db8:0::1\n',
+                     'An IPv6: ' + _styled_ip('2001:db8:0::1') + '\n',
+                     id='9_zero-segment-before-double-colon'),
+
+        pytest.param('Not an IPv6: ::\n',
+                     '',
+                     id='10_bare-double-colon'),
+
+        pytest.param('Not an IPv6: 1::2:3:4:5:6:7:8\n',
+                     '',
+                     id='11_double-colon-and-eight-segments'),
+
+        pytest.param('An IPv6: fe80::1:\n',
+                     'An IPv6: ' + _styled_ip('fe80::1') + ':\n',
+                     id='12_trailing-colon-excluded'),
     ]
 )
 def test_ipv6(invoker: Invoker,
               stdin: Optional[str],
-              expected_value: str | int
+              expected_stdout: str
               ) -> None:
     invoker(
         CliArgs(ipv6=True),
         stdin,
-        Expect(**{
-            ('exit_code' if isinstance(expected_value, int) else 'stdout'):
-                expected_value}))
+        Expect(stdout=expected_stdout))
+
+
+@pytest.mark.parametrize(
+    ('args', 'stdin', 'expected_stdout'),
+    [
+        pytest.param(CliArgs(timestamps=True),
+                     (line_number_log(2) +
+                      timestamp_log(3) +
+                      line_number_log(2, 6)),
+                     timestamp_log(3),
+                     id='1_timestamps'),
+
+        pytest.param(CliArgs(ipv4=True),
+                     (line_number_log(2) +
+                      ipv4_log(3) +
+                      line_number_log(2, 6)),
+                     ipv4_log(3),
+                     id='2_ipv4'),
+
+        pytest.param(CliArgs(ipv6=True),
+                     (line_number_log(2) +
+                      ipv6_log(3) +
+                      line_number_log(2, 6)),
+                     ipv6_log(3),
+                     id='3_ipv6'),
+
+        pytest.param(CliArgs(timestamps=True, ipv4=True, ipv6=True),
+                     (timestamp_log(2) +
+                      line_number_log(2, 2) +
+                      ipv4_log(2) +
+                      ipv6_log(2)),
+                     (timestamp_log(2) +
+                      ipv4_log(2) +
+                      ipv6_log(2)),
+                     id='4_all-filters'),
+    ]
+)
+def test_no_color(invoker: Invoker,
+                  args: CliArgs,
+                  stdin: Optional[str],
+                  expected_stdout: str
+                  ) -> None:
+    invoker(
+        args,
+        stdin,
+        Expect(stdout=expected_stdout),
+        color=False)
+
+
+@pytest.mark.parametrize(
+    ('args', 'nlines'),
+    [
+        pytest.param(CliArgs(first=5000),
+                     3000,
+                     id='1_first'),
+
+        pytest.param(CliArgs(timestamps=True),
+                     3000,
+                     id='2_timestamps'),
+
+        pytest.param(CliArgs(timestamps=True),
+                     500,
+                     id='3_timestamps_short-log'),
+    ]
+)
+def test_decode_error(invoker: Invoker, args: CliArgs, nlines: int) -> None:
+    # an invalid utf-8 byte in the last line of the log
+    stdin: bytes = timestamp_log(nlines).encode()
+    stdin = stdin[:-5] + b'\xff' + stdin[-5:]
+
+    # every line that can be read before the error is expected to be printed
+    lines_read: int = 0
+
+    with io.TextIOWrapper(io.BytesIO(stdin), encoding='utf-8') as lines:
+        try:
+            for _ in lines:
+                lines_read += 1
+        except UnicodeDecodeError:
+            pass
+
+    result = invoker(args,
+                     stdin,
+                     Expect(exit_code=1, stdout=timestamp_log(lines_read)),
+                     color=False)
+
+    assert isinstance(result.exception, UnicodeDecodeError)
+
+
+
+@pytest.mark.parametrize(
+    ('args', 'line'),
+    [
+        pytest.param(CliArgs(timestamps=True),
+                     b'[12:34:56]: Timestamp\n',
+                     id='1_timestamps'),
+
+        pytest.param(CliArgs(first=5),
+                     b'Line 1\n',
+                     id='2_first'),
+
+        pytest.param(CliArgs(timestamps=True, ipv4=True),
+                     b'[12:34:56]: An IPv4: 192.168.1.1\n',
+                     id='3_timestamps-ipv4'),
+    ]
+)
+def test_streaming(args: CliArgs, line: bytes) -> None:
+    """Checks that a line written to a live pipe is printed before the pipe 
+    is closed, which `CliRunner` cannot check as its stdin never blocks."""
+
+    # the package may not be installed, so point the child process at the
+    # same copy of it that the tests import
+    env: dict[str, str] = dict(os.environ)
+    env['PYTHONPATH'] = os.pathsep.join(
+        [os.path.dirname(os.path.dirname(pylogutil.__file__)),
+         *filter(None, [env.get('PYTHONPATH')])])
+
+    output: queue.Queue[bytes] = queue.Queue()
+
+    with subprocess.Popen(
+            [sys.executable, '-m', 'pylogutil', *args.to_arg_list()],
+            stdin=subprocess.PIPE, stdout=subprocess.PIPE,
+            env=env) as process:
+
+        # read from another thread, so that a line that is held back fails
+        # the test after a timeout rather than blocking it
+        reader = threading.Thread(
+            target=lambda: output.put(process.stdout.readline()))
+        reader.start()
+
+        try:
+            process.stdin.write(line)
+            process.stdin.flush()
+
+            try:
+                assert (output.get(timeout=10).rstrip(b'\r\n') ==
+                        line.rstrip())
+            except queue.Empty:
+                pytest.fail('the line was not printed until stdin was closed')
+        finally:
+            # closing stdin lets the process exit, which in turn ends the
+            # reader's `readline` (the process is killed if it does not)
+            process.stdin.close()
+
+            try:
+                process.wait(timeout=10)
+            except subprocess.TimeoutExpired:
+                process.kill()
+
+            reader.join()